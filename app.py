@@ -5,14 +5,21 @@ A professional Streamlit application for exploring mutual fund data with advance
 
 import streamlit as st
 import pandas as pd
+import numpy as np
 from pathlib import Path
+import io
 import math
+import xxhash
+import pyarrow as pa
+import pyarrow.csv as pa_csv
 import plotly.graph_objects as go
 from config import (
     APP_TITLE, APP_ICON, APP_LAYOUT, SIDEBAR_STATE,
-    ITEMS_PER_PAGE, RISK_ORDER, RISK_RATING_MAPPINGS,
-    DATA_FOLDER, CLEANED_CSV_NAME, NAV_RANGE_DEFAULT
+    ITEMS_PER_PAGE, RISK_ORDER, RISK_RATING_MAPPINGS, RISK_LOOKUP,
+    DATA_FOLDER, CLEANED_CSV_NAME, NAV_RANGE_DEFAULT, CSV_SCHEMA,
+    PARTIAL_SORT_MAX_ROWS, PERFORMANCE_PERIODS, PERFORMANCE_INFO_COLUMNS, FILTER_CACHE_MAX_ENTRIES
 )
+from data_utils import parse_accounting_numbers, lowercased_names, read_csv_typed, sidecar_tag, read_sidecar, write_sidecar
 
 # Page configuration
 st.set_page_config(
@@ -23,45 +30,70 @@ st.set_page_config(
 )
 
 # Load CSS from external file with fallback
+@st.cache_resource
+def read_css_file():
+    """Read the external CSS file once per process instead of on every rerun"""
+    return Path("styles/style.css").read_text()
+
 def load_css():
-    """Load external CSS file"""
+    """Load external CSS file, plus the Dashboard's own sidebar rule"""
     try:
-        with open("styles/style.css", "r") as f:
-            st.markdown(f"<style>{f.read()}</style>", unsafe_allow_html=True)
+        css = read_css_file()
     except FileNotFoundError:
         # Fallback inline CSS - Compact version
-        st.markdown("""
-            <style>
-                .main { padding-top: 0.5rem; }
-                h1 { font-size: 24px !important; margin-bottom: 5px !important; }
-                .metric-container {
-                    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%) !important;
-                    color: white; padding: 12px 15px !important; border-radius: 0.6rem !important;
-                    margin: 2px 0 !important; text-align: center; font-size: 12px !important;
-                }
-                .metric-value { font-size: 16px !important; font-weight: bold !important; margin: 2px 0 !important; }
-                .metric-label { font-size: 10px !important; opacity: 0.9 !important; text-transform: uppercase; margin-bottom: 2px !important; }
-                .stTabs [data-baseweb="tab-list"] button { font-size: 16px !important; padding: 12px 20px !important; font-weight: 600 !important; }
-                .stTabs [data-baseweb="tab-list"] { gap: 15px !important; }
-                [data-testid="stSelectbox"] label { display: none !important; }
-            </style>
-        """, unsafe_allow_html=True)
+        css = """
+            .main { padding-top: 0.5rem; }
+            [data-testid="stSidebarNav"] { display: none !important; }
+            h1 { font-size: 24px !important; margin-bottom: 5px !important; }
+            .metric-container {
+                background: linear-gradient(135deg, #667eea 0%, #764ba2 100%) !important;
+                color: white; padding: 12px 15px !important; border-radius: 0.6rem !important;
+                margin: 2px 0 !important; text-align: center; font-size: 12px !important;
+            }
+            .metric-value { font-size: 16px !important; font-weight: bold !important; margin: 2px 0 !important; }
+            .metric-label { font-size: 10px !important; opacity: 0.9 !important; text-transform: uppercase; margin-bottom: 2px !important; }
+            .stTabs [data-baseweb="tab-list"] button { font-size: 16px !important; padding: 12px 20px !important; font-weight: 600 !important; letter-spacing: 0.5px !important; }
+            .stTabs [data-baseweb="tab-list"] { gap: 15px !important; }
+            .page-tab-switcher { display: flex; justify-content: center; gap: 0px; margin-bottom: 20px; }
+            .page-tab {
+                padding: 12px 30px; font-size: 16px; font-weight: 600; border: none; cursor: pointer;
+                transition: all 0.3s ease; background-color: #e0e0e0; color: #333; border-radius: 0;
+            }
+            .page-tab:first-child { border-radius: 8px 0 0 8px; }
+            .page-tab:last-child { border-radius: 0 8px 8px 0; }
+            .page-tab.active { background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; }
+            .page-tab:hover:not(.active) { background-color: #d0d0d0; }
+            .pagination-info { text-align: center; font-size: 0.9rem; color: #666; margin: 0.5rem 0; }
+            [data-testid="stSelectbox"] label { display: none !important; }
+        """
+    
+    # Sidebar visibility is set per page (see styles/style.css) - the Dashboard shows it
+    st.markdown(
+        f'<style>{css}\n[data-testid="stSidebar"] {{ display: block !important; }}</style>',
+        unsafe_allow_html=True
+    )
 
 load_css()
 
-@st.cache_data
 def load_csv():
     """Load CSV file from data folder - prefer cleaned file"""
     data_folder = Path("data")
-    
-    # First try to load cleaned CSV
+
+    # First try to load cleaned CSV (via its Parquet sidecar when up to date)
     cleaned_csv = data_folder / "funds_clean.csv"
     if cleaned_csv.exists():
-        try:
-            df = pd.read_csv(cleaned_csv)
+        # The sidecar records the CSV_SCHEMA it was typed with, so a schema edit rebuilds it too
+        schema_tag = sidecar_tag(CSV_SCHEMA)
+        df = read_sidecar(cleaned_csv, schema_tag)
+        if df is not None:
             return df, cleaned_csv.name
+        try:
+            df = read_csv_typed(cleaned_csv)
         except Exception as e:
             st.warning(f"Could not load cleaned CSV: {e}")
+        else:
+            write_sidecar(df, cleaned_csv, schema_tag)
+            return df, cleaned_csv.name
     
     # Fallback to any CSV file
     csv_files = list(data_folder.glob("*.csv"))
@@ -71,63 +103,171 @@ def load_csv():
     # Prefer the largest CSV file
     csv_file = max(csv_files, key=lambda x: x.stat().st_size)
     try:
-        df = pd.read_csv(csv_file)
+        df = read_csv_typed(csv_file)
         return df, csv_file.name
     except Exception as e:
         st.error(f"Error loading CSV: {e}")
         return None, None
 
 def convert_rating_to_risk_level(rating):
-    """Convert MUFAP rating (AAA(f), AA+(f), etc.) to user-friendly risk level"""
-    if pd.isna(rating) or rating == '':
-        return 'High'
-    
-    rating_str = str(rating).strip().lower()
-    
-    # Very Low Risk: AAA, AA+
-    if rating_str in ['aaa(f)', 'aaa', 'aa+(f)', 'aa+']:
-        return 'Very Low'
-    
-    # Low Risk: AA, AA-
-    elif rating_str in ['aa(f)', 'aa', 'aa-(f)', 'aa-']:
-        return 'Low'
-    
-    # Medium Risk: A+, A
-    elif rating_str in ['a+(f)', 'a+', 'a(f)', 'a']:
-        return 'Medium'
-    
-    # High Risk: A-, BBB and below
-    elif rating_str in ['a-(f)', 'a-', 'bbb(f)', 'bbb', 'bbb+(f)', 'bbb+', 'bbb-(f)', 'bbb-', 'bb(f)', 'bb', 'b(f)', 'b']:
-        return 'High'
-    
-    else:
-        return 'High'
+    """Convert a single MUFAP rating (AAA(f), AA+(f), etc.) to user-friendly risk level"""
+    return RISK_LOOKUP.get(str(rating).strip().lower(), 'High')
 
 def detect_columns(df):
-    """Auto-detect important columns"""
+    """Auto-detect important columns - each column fills at most one role, and the first match for a role wins"""
     col_map = {}
+    name_col = None
     
     for col in df.columns:
         col_lower = col.lower().strip()
         
         if 'fund' in col_lower and 'name' in col_lower:
-            col_map['fund_name'] = col
-        elif 'name' in col_lower and 'fund' not in col_lower:
-            if 'fund_name' not in col_map:
-                col_map['fund_name'] = col
+            key = 'fund_name'
+        elif 'name' in col_lower:
+            # A plain "Name" column only stands in when there is no "Fund Name" column
+            name_col = name_col or col
+            continue
         elif 'company' in col_lower or 'amc' in col_lower:
-            col_map['company'] = col
+            key = 'company'
         elif 'nav' in col_lower:
-            col_map['nav'] = col
+            key = 'nav'
         elif 'category' in col_lower:
-            col_map['category'] = col
+            key = 'category'
         elif 'risk' in col_lower or 'rating' in col_lower:
-            col_map['risk'] = col
+            key = 'risk'
         elif 'offer' in col_lower and 'price' in col_lower:
-            col_map['offer_price'] = col
+            key = 'offer_price'
+        else:
+            continue
+        
+        col_map.setdefault(key, col)
+    
+    if name_col:
+        col_map.setdefault('fund_name', name_col)
     
     return col_map
 
+# cache_resource hands every rerun the same DataFrame without copying it - treat it as read-only
+@st.cache_resource
+def load_and_prepare():
+    """Load the fund CSV once, detect its columns and derive the Risk Level column"""
+    df, filename = load_csv()
+    if df is None:
+        return None, None, {}
+    
+    col_map = detect_columns(df)
+    
+    # Filter columns as category, whatever the CSV calls them, so isin/groupby/value_counts work on codes
+    for key in ('category', 'company'):
+        col = col_map.get(key)
+        if col and not isinstance(df[col].dtype, pd.CategoricalDtype):
+            df[col] = df[col].astype('category')
+    
+    # Convert Risk Ratings to User-Friendly Levels
+    if col_map.get('risk'):
+        ratings = df[col_map['risk']].astype('string').str.strip().str.lower()
+        df['Risk Level'] = ratings.map(RISK_LOOKUP).fillna('High').astype('category')
+        col_map['risk_level'] = 'Risk Level'  # Use converted column
+    
+    return df, filename, col_map
+
+def sorted_options(series):
+    """Sorted unique non-null values of a column - read off the categories for categorical columns"""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return series.cat.remove_unused_categories().cat.categories.tolist()
+    return sorted(series.dropna().unique().tolist())
+
+def risk_options(series):
+    """Risk levels present in a column, in RISK_ORDER"""
+    present = set(sorted_options(series))
+    return [risk for risk in RISK_ORDER if risk in present]
+
+@st.cache_resource
+def nav_sort_index(filename, nav_col, _nav_values):
+    """Row positions that sort the NAV column, plus the sorted values, for range lookups"""
+    nav_order = np.argsort(_nav_values, kind='stable')
+    return nav_order, _nav_values[nav_order]
+
+@st.cache_data
+def nav_bounds(filename, nav_col, _nav_values):
+    """Smallest and largest NAV, the limits of the sidebar range slider"""
+    return float(np.nanmin(_nav_values)), float(np.nanmax(_nav_values))
+
+def nav_range_mask(nav_order, nav_sorted, low, high):
+    """NumPy mask of rows with low <= NAV <= high, via two binary searches on the sorted NAVs"""
+    # Plain float bounds - NumPy promotes integer NAV columns to float64 rather than truncating the bounds
+    left = np.searchsorted(nav_sorted, float(low), 'left')
+    right = np.searchsorted(nav_sorted, float(high), 'right')
+    nav_mask = np.zeros(len(nav_order), dtype=bool)
+    nav_mask[nav_order[left:right]] = True
+    return nav_mask
+
+def isin_mask(series, selected):
+    """NumPy mask of series.isin(selected) - compares integer codes for categorical columns"""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        selected_codes = series.cat.categories.get_indexer(list(selected))
+        return np.isin(series.cat.codes.to_numpy(), selected_codes[selected_codes >= 0])
+    return series.isin(selected).to_numpy()
+
+def mask_signature(mask):
+    """Cheap key identifying a filter result, used to reuse work across reruns"""
+    # xxh3 hashes the mask buffer directly - no bytes copy, far faster than md5/SHA
+    return xxhash.xxh3_64_intdigest(mask)
+
+def sorted_positions(filtered_df, sort_key):
+    """Row positions of filtered_df in table order, kept in session state until sort_key changes"""
+    if st.session_state.get('sort_key') != sort_key:
+        _, sort_by, sort_reverse = sort_key
+        # Sort just the one column, re-indexed by position, so the result can feed DataFrame.take
+        sort_column = filtered_df[sort_by].reset_index(drop=True)
+        st.session_state.sort_key = sort_key
+        st.session_state.sorted_positions = sort_column.sort_values(
+            ascending=not sort_reverse, kind='stable'
+        ).index.to_numpy()
+    return st.session_state.sorted_positions
+
+@st.cache_data(max_entries=FILTER_CACHE_MAX_ENTRIES)
+def filtered_csv_bytes(filter_sig, filename, sort_by, sort_reverse, _filtered_df):
+    """Sorted filtered data as CSV bytes, serialized once per filter result and sort order"""
+    display_df = _filtered_df.sort_values(by=sort_by, ascending=not sort_reverse, kind='stable')
+    buf = io.BytesIO()
+    # Arrow's CSV writer is considerably faster than DataFrame.to_csv
+    pa_csv.write_csv(pa.Table.from_pandas(display_df, preserve_index=False), buf)
+    return buf.getvalue()
+
+def observed_counts(series):
+    """value_counts() without the zero rows a categorical column reports for unused categories"""
+    counts = series.value_counts()
+    return counts[counts > 0]
+
+@st.cache_data(max_entries=FILTER_CACHE_MAX_ENTRIES)
+def analytics_bundle(filter_sig, filename, fund_col, nav_col, cat_col, risk_col, _filtered_df):
+    """Aggregations for the Analytics and By Risk tabs, computed once per filter result"""
+    bundle = {
+        'nav_distribution': _filtered_df[nav_col].value_counts().sort_index().head(20),
+        'category_counts': observed_counts(_filtered_df[cat_col]) if cat_col else None,
+        'top_nav': _filtered_df.nlargest(10, nav_col)[[fund_col, nav_col]],
+        'risk_counts': None,
+        'risk_stats': None,
+        'avg_nav_by_risk': None
+    }
+    
+    if risk_col:
+        bundle['risk_counts'] = observed_counts(_filtered_df[risk_col])
+        
+        # One named-aggregation pass feeds both the stats table and the average NAV chart
+        risk_stats = _filtered_df.groupby(risk_col, observed=True).agg(**{
+            'Number of Funds': (fund_col, 'count'),
+            'Avg NAV': (nav_col, 'mean'),
+            'Min NAV': (nav_col, 'min'),
+            'Max NAV': (nav_col, 'max')
+        })
+        bundle['risk_stats'] = risk_stats.round(2).sort_values('Number of Funds', ascending=False)
+        
+        bundle['avg_nav_by_risk'] = risk_stats['Avg NAV'].rename(nav_col).sort_values(ascending=False)
+    
+    return bundle
+
 def reset_filters():
     """Reset all filters to default"""
     st.session_state.category_filter = []
@@ -138,59 +278,114 @@ def reset_filters():
     st.session_state.current_page = 1
     st.session_state.selected_tab = 0  # Initialize selected tab to first tab
 
+def go_to_first_page():
+    """Show the first page of results (Apply Filters button)"""
+    st.session_state.current_page = 1
+
+def go_to_previous_page():
+    """Step back one page in the data table"""
+    if st.session_state.current_page > 1:
+        st.session_state.current_page -= 1
+
+def go_to_next_page(total_pages):
+    """Step forward one page in the data table"""
+    if st.session_state.current_page < total_pages:
+        st.session_state.current_page += 1
+
+def go_to_selected_page():
+    """Jump to the page picked in the page selector"""
+    st.session_state.current_page = st.session_state.page_selector
+
+def remember_selected_period():
+    """Copy the period radio's choice into selected_period, which outlives the widget"""
+    st.session_state.selected_period = st.session_state.period_radio
+
+@st.cache_data
 def load_performance_data():
-    """Load performance data from the summary CSV"""
+    """Load performance data from the summary CSV, indexed by fund name, plus the set of names"""
     try:
         performance_file = Path("data") / "Performance Summary  MUTUAL FUNDS ASSOCIATION OF PAKISTAN.csv"
         if performance_file.exists():
-            # Skip the first row which is a title row
-            df = pd.read_csv(performance_file, skiprows=1)
-            return df
+            # Skip the first row which is a title row, and only read the columns the analysis shows
+            header = pd.read_csv(performance_file, skiprows=1, nrows=0).columns
+            numeric_cols = [col for col in ['NAV'] + PERFORMANCE_PERIODS if col in header]
+            usecols = [col for col in PERFORMANCE_INFO_COLUMNS if col in header] + numeric_cols
+            df = pd.read_csv(performance_file, skiprows=1, usecols=usecols, dtype='string')
+            for col in numeric_cols:
+                df[col] = parse_accounting_numbers(df[col])
+            df = df.set_index('Fund Name', drop=False)
+            return df, frozenset(df.index)
     except Exception as e:
         st.warning(f"Could not load performance data: {e}")
-    return None
+    return None, frozenset()
+
+@st.cache_data
+def performance_figure(fund_name, periods, values):
+    """Line chart of a fund's returns across periods, with an empty 'Selected Period' marker trace to fill in"""
+    fig = go.Figure()
+    
+    # Add line trace for all data
+    fig.add_trace(go.Scattergl(
+        x=list(periods),
+        y=list(values),
+        mode='lines+markers',
+        name=fund_name,
+        line=dict(color='#667eea', width=3),
+        marker=dict(size=8),
+        hovertemplate='<b>%{x}</b><br>Return: %{y:.2f}%<extra></extra>'
+    ))
+    
+    # Placeholder for the selected period's highlight marker
+    fig.add_trace(go.Scattergl(
+        x=[None],
+        y=[None],
+        mode='markers',
+        marker=dict(size=15, color='#FF6B6B', symbol='star'),
+        name='Selected Period',
+        hovertemplate='<b>%{x}</b><br>Return: %{y:.2f}%<extra></extra>'
+    ))
+    
+    fig.update_layout(
+        title=f"{fund_name} - Performance Across Time Periods",
+        xaxis_title="Time Period",
+        yaxis_title="Return (%)",
+        hovermode='x unified',
+        height=450,
+        template='plotly_white'
+    )
+    return fig
 
 def show_fund_performance_analysis(fund_name, performance_df):
     """Display interactive fund performance analysis with line chart"""
     st.markdown("---")
     st.subheader(f"📈 {fund_name} - Performance Analysis")
     
-    # Filter performance data for selected fund
-    fund_data = performance_df[performance_df['Fund Name'] == fund_name]
-    
-    if fund_data.empty:
+    # Look up the selected fund on the Fund Name index
+    if fund_name not in performance_df.index:
         st.warning(f"Performance data not available for {fund_name}")
         return
+    fund_data = performance_df.loc[[fund_name]]
     
-    # Performance columns available
-    performance_columns = ['YTD', 'MTD', '1 Day', '15 Days', '30 Days', 
-                          '90 Days', '180 Days', '270 Days', '365 Days', '2 Years', '3 Years']
-    
-    # Filter only available columns
-    available_columns = [col for col in performance_columns if col in performance_df.columns]
+    # Performance columns available in the summary
+    available_columns = [col for col in PERFORMANCE_PERIODS if col in performance_df.columns]
     
     # Initialize session state for selected period (default to 3 Years)
     if 'selected_fund' not in st.session_state or st.session_state.selected_fund != fund_name:
         st.session_state.selected_fund = fund_name
-        st.session_state.selected_period = '3 Years'
-    
-    # Time period buttons with highlighting
-    st.markdown("**Select Time Period:**")
-    button_cols = st.columns(len(available_columns))
-    
-    for idx, col_name in enumerate(available_columns):
-        with button_cols[idx]:
-            # Check if this button is the selected period
-            is_selected = col_name == st.session_state.selected_period
-            
-            # Create button with different styling if selected
-            if is_selected:
-                if st.button(f"✓ {col_name}", key=f"perf_{fund_name}_{col_name}", use_container_width=True):
-                    st.session_state.selected_period = col_name
-            else:
-                if st.button(col_name, key=f"perf_{fund_name}_{col_name}", use_container_width=True):
-                    st.session_state.selected_period = col_name
-    
+        st.session_state.selected_period = '3 Years' if '3 Years' in available_columns else available_columns[0]
+        st.session_state.period_radio = st.session_state.selected_period
+    
+    # One radio for all time periods. The period lives in a plain session key as well as the widget's,
+    # since Streamlit drops widget keys on any run where the radio isn't rendered - reseed it from there
+    if 'period_radio' not in st.session_state:
+        st.session_state.period_radio = st.session_state.selected_period
+    st.radio(
+        "**Select Time Period:**",
+        available_columns,
+        horizontal=True,
+        key="period_radio",
+        on_change=remember_selected_period
+    )
     selected_period = st.session_state.selected_period
     
     # Get fund details
@@ -210,65 +405,29 @@ def show_fund_performance_analysis(fund_name, performance_df):
         validity = str(fund_row['Validity Date']) if 'Validity Date' in fund_row else "N/A"
         st.metric("Validity Date", validity)
     
+    # Convert every period's return in one pass (non-numeric entries such as "N/A" become NaN)
+    periods = available_columns
+    period_values = pd.to_numeric(fund_row.reindex(periods), errors='coerce')
+    values = period_values.fillna(0).to_numpy()
+    
     # Display the selected period value
     if selected_period in performance_df.columns:
-        perf_value = fund_row[selected_period]
-        if pd.notna(perf_value):
-            try:
-                perf_float = float(perf_value)
-                st.markdown(f"**{selected_period} Return:** `{perf_float:.2f}%`")
-            except:
-                st.markdown(f"**{selected_period} Return:** `{perf_value}`")
+        if pd.notna(period_values[selected_period]):
+            st.markdown(f"**{selected_period} Return:** `{period_values[selected_period]:.2f}%`")
         else:
             st.markdown(f"**{selected_period} Return:** `N/A`")
     
     # Create LINE CHART showing all periods with highlighted selected period
     st.markdown(f"**Performance Data - {selected_period}:**")
     
-    # Prepare data for all periods
-    periods = available_columns
-    values = []
-    for period in periods:
-        try:
-            val = float(fund_row[period]) if period in fund_row.index and pd.notna(fund_row[period]) else 0
-            values.append(val)
-        except:
-            values.append(0)
-    
-    fig = go.Figure()
-    
-    # Add line trace for all data
-    fig.add_trace(go.Scatter(
-        x=periods,
-        y=values,
-        mode='lines+markers',
-        name=fund_name,
-        line=dict(color='#667eea', width=3),
-        marker=dict(size=8),
-        hovertemplate='<b>%{x}</b><br>Return: %{y:.2f}%<extra></extra>'
-    ))
-    
     # Highlight the selected period with a special marker
     selected_idx = periods.index(selected_period) if selected_period in periods else 0
     selected_value = values[selected_idx] if selected_idx < len(values) else 0
     
-    fig.add_trace(go.Scatter(
-        x=[selected_period],
-        y=[selected_value],
-        mode='markers',
-        marker=dict(size=15, color='#FF6B6B', symbol='star'),
-        name='Selected Period',
-        hovertemplate='<b>%{x}</b><br>Return: %{y:.2f}%<extra></extra>'
-    ))
-    
-    fig.update_layout(
-        title=f"{fund_name} - Performance Across Time Periods",
-        xaxis_title="Time Period",
-        yaxis_title="Return (%)",
-        hovermode='x unified',
-        height=450,
-        template='plotly_white'
-    )
+    # The line only depends on the fund, so reuse its cached figure and just move the marker
+    fig = performance_figure(fund_name, tuple(periods), tuple(values.tolist()))
+    fig.data[1].x = [selected_period]
+    fig.data[1].y = [selected_value]
     
     st.plotly_chart(fig, use_container_width=True)
     
@@ -276,7 +435,7 @@ def show_fund_performance_analysis(fund_name, performance_df):
 
 def main():
     # Load data
-    df, filename = load_csv()
+    df, filename, col_map = load_and_prepare()
     
     if df is None:
         st.error("❌ No CSV file found!")
@@ -287,9 +446,6 @@ def main():
         """)
         return
     
-    # Detect columns
-    col_map = detect_columns(df)
-    
     if 'fund_name' not in col_map:
         st.error("❌ Could not find fund name column")
         st.info("Expected columns: Fund Name, Name, Fund, etc.")
@@ -299,60 +455,6 @@ def main():
         st.error("❌ Could not find NAV column")
         return
     
-    # Convert Risk Ratings to User-Friendly Levels
-    if col_map.get('risk'):
-        df['Risk Level'] = df[col_map['risk']].apply(convert_rating_to_risk_level)
-        col_map['risk_level'] = 'Risk Level'  # Use converted column
-    
-    # Header - Compact version
-    st.markdown("""
-        <style>
-        /* Show Sidebar on Dashboard (default behavior) */
-        [data-testid="stSidebar"] { display: block !important; }
-        
-        h1 { font-size: 24px !important; margin-bottom: 5px !important; }
-        .metric-container {
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%) !important;
-            color: white; padding: 12px 15px !important; border-radius: 0.6rem !important;
-            margin: 2px 0 !important; text-align: center; font-size: 12px !important;
-        }
-        .metric-label { font-size: 10px !important; opacity: 0.9 !important; text-transform: uppercase; margin-bottom: 2px !important; }
-        .metric-value { font-size: 16px !important; font-weight: bold !important; margin: 2px 0 !important; }
-        
-        /* Page Tab Switcher Styling */
-        .page-tab-switcher {
-            display: flex;
-            justify-content: center;
-            gap: 0px;
-            margin-bottom: 20px;
-        }
-        .page-tab {
-            padding: 12px 30px;
-            font-size: 16px;
-            font-weight: 600;
-            border: none;
-            cursor: pointer;
-            transition: all 0.3s ease;
-            background-color: #e0e0e0;
-            color: #333;
-            border-radius: 0;
-        }
-        .page-tab:first-child {
-            border-radius: 8px 0 0 8px;
-        }
-        .page-tab:last-child {
-            border-radius: 0 8px 8px 0;
-        }
-        .page-tab.active {
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-        }
-        .page-tab:hover:not(.active) {
-            background-color: #d0d0d0;
-        }
-        </style>
-    """, unsafe_allow_html=True)
-    
     # Page Tab Switcher UI with centered layout
     nav_col1, nav_col2, nav_col3 = st.columns([1, 1, 1])
     
@@ -374,14 +476,18 @@ def main():
         st.session_state.company_filter = []
     if 'risk_filter' not in st.session_state:
         st.session_state.risk_filter = []
+    # NAV limits only change with the data, so scan the column once per file
+    nav_min, nav_max = nav_bounds(filename, col_map['nav'], df[col_map['nav']].to_numpy())
     if 'nav_range' not in st.session_state:
-        nav_min = float(df[col_map['nav']].min())
-        nav_max = float(df[col_map['nav']].max())
         st.session_state.nav_range = [nav_min, nav_max]
     if 'search_term' not in st.session_state:
         st.session_state.search_term = ""
     if 'current_page' not in st.session_state:
         st.session_state.current_page = 1
+    if st.session_state.get('filter_options_df') != id(df):
+        # Sidebar option lists, memoized per filter selection for the currently loaded data
+        st.session_state.filter_options = {}
+        st.session_state.filter_options_df = id(df)
     
     # Sidebar - Filters
     st.sidebar.header("🔍 Filters")
@@ -393,27 +499,33 @@ def main():
     comp_col = col_map.get('company')
     risk_col = col_map.get('risk_level', col_map.get('risk'))  # Use converted risk level if available
     
-    # Start with full dataframe for dynamic filtering
-    dynamic_df = df.copy()
-    
-    # Apply risk filter first if selected
-    if st.session_state.risk_filter:
-        if 'Risk Level' in dynamic_df.columns:
-            dynamic_df = dynamic_df[dynamic_df['Risk Level'].isin(st.session_state.risk_filter)]
+    # Option lists only change with the filter selections they depend on, so reuse them across reruns
+    filter_options = st.session_state.filter_options
+    
+    # Get categories based on dynamically filtered data (risk filter applied first, as a mask)
+    categories_key = ('categories', tuple(st.session_state.risk_filter))
+    if categories_key not in filter_options:
+        if not cat_col:
+            filter_options[categories_key] = []
+        elif st.session_state.risk_filter and 'Risk Level' in df.columns:
+            risk_mask = isin_mask(df['Risk Level'], st.session_state.risk_filter)
+            filter_options[categories_key] = sorted_options(df.loc[risk_mask, cat_col])
+        else:
+            filter_options[categories_key] = sorted_options(df[cat_col])
+    categories = filter_options[categories_key]
     
-    # Get categories based on dynamically filtered data
-    categories = sorted(dynamic_df[cat_col].dropna().unique().tolist()) if cat_col else []
-    companies = sorted(df[comp_col].dropna().unique().tolist()) if comp_col else []
+    if 'companies' not in filter_options:
+        filter_options['companies'] = sorted_options(df[comp_col]) if comp_col else []
+    companies = filter_options['companies']
     
     # Get risk levels based on full data (we'll update this after category selection)
-    if risk_col and risk_col in df.columns:
-        risk_order = ['Very Low', 'Low', 'Medium', 'High']
-        all_risks = df[risk_col].dropna().unique().tolist()
-        all_risks_list = [r for r in risk_order if r in all_risks]
-    else:
-        all_risks_list = []
+    if 'risks' not in filter_options:
+        if risk_col and risk_col in df.columns:
+            filter_options['risks'] = risk_options(df[risk_col])
+        else:
+            filter_options['risks'] = []
     
-    risks = all_risks_list
+    risks = filter_options['risks']
     
     # Filter: Search by fund name
     st.sidebar.markdown("### 🔎 Search Fund Name")
@@ -439,12 +551,12 @@ def main():
         st.sidebar.markdown("---")
         
         # Update risk levels based on selected categories
-        if st.session_state.category_filter:
-            category_filtered_df = df[df[cat_col].isin(st.session_state.category_filter)]
-            if 'Risk Level' in category_filtered_df.columns:
-                risk_order = ['Very Low', 'Low', 'Medium', 'High']
-                category_risks = category_filtered_df['Risk Level'].dropna().unique().tolist()
-                risks = [r for r in risk_order if r in category_risks]
+        if st.session_state.category_filter and 'Risk Level' in df.columns:
+            risks_key = ('risks', tuple(st.session_state.category_filter))
+            if risks_key not in filter_options:
+                category_mask = isin_mask(df[cat_col], st.session_state.category_filter)
+                filter_options[risks_key] = risk_options(df.loc[category_mask, 'Risk Level'])
+            risks = filter_options[risks_key]
     
     # Filter: Company
     if companies:
@@ -472,8 +584,6 @@ def main():
     
     # Filter: NAV Range
     st.sidebar.markdown("### 💰 NAV Range (Rs.)")
-    nav_min = float(df[nav_col].min())
-    nav_max = float(df[nav_col].max())
     
     nav_range = st.sidebar.slider(
         "Select NAV Range",
@@ -489,44 +599,41 @@ def main():
     # Filter buttons
     col1, col2 = st.sidebar.columns(2)
     with col1:
-        if st.button("🔄 Apply Filters"):
-            st.session_state.current_page = 1
-            st.rerun()
+        # Callbacks run before the next rerun, so no explicit st.rerun() is needed
+        st.button("🔄 Apply Filters", on_click=go_to_first_page)
     with col2:
-        if st.button("🗑️ Clear All"):
-            reset_filters()
-            st.rerun()
+        st.button("🗑️ Clear All", on_click=reset_filters)
     
-    # Apply all filters
-    filtered_df = df.copy()
+    # Apply all filters - combine the predicates into one mask and slice once
+    mask = np.ones(len(df), dtype=bool)
     
     # Search filter
     if search_term:
-        filtered_df = filtered_df[
-            filtered_df[fund_col].str.contains(search_term, case=False, na=False)
-        ]
+        mask &= np.char.find(lowercased_names(filename, fund_col, df[fund_col]), search_term.lower()) >= 0
     
     # Category filter
     if st.session_state.category_filter and cat_col:
-        filtered_df = filtered_df[filtered_df[cat_col].isin(st.session_state.category_filter)]
+        mask &= isin_mask(df[cat_col], st.session_state.category_filter)
     
     # Company filter
     if st.session_state.company_filter and comp_col:
-        filtered_df = filtered_df[filtered_df[comp_col].isin(st.session_state.company_filter)]
+        mask &= isin_mask(df[comp_col], st.session_state.company_filter)
     
     # Risk filter
     if st.session_state.risk_filter:
         # Always use the converted Risk Level column for filtering
-        if 'Risk Level' in filtered_df.columns:
-            filtered_df = filtered_df[filtered_df['Risk Level'].isin(st.session_state.risk_filter)]
+        if 'Risk Level' in df.columns:
+            mask &= isin_mask(df['Risk Level'], st.session_state.risk_filter)
     
     # NAV range filter
-    filtered_df = filtered_df[
-        (filtered_df[nav_col] >= st.session_state.nav_range[0]) &
-        (filtered_df[nav_col] <= st.session_state.nav_range[1])
-    ]
+    nav_order, nav_sorted = nav_sort_index(filename, nav_col, df[nav_col].to_numpy())
+    mask &= nav_range_mask(nav_order, nav_sorted, st.session_state.nav_range[0], st.session_state.nav_range[1])
+    
+    filtered_df = df[mask]
+    filter_sig = mask_signature(mask)
     
     # Main content - Metrics (Compact)
+    nav_stats = filtered_df[nav_col].agg(['mean', 'max', 'min'])  # One call for all three NAV cards
     col1, col2, col3, col4 = st.columns(4, gap="small")
     
     with col1:
@@ -538,51 +645,31 @@ def main():
         """.format(len(filtered_df)), unsafe_allow_html=True)
     
     with col2:
-        avg_nav = filtered_df[nav_col].mean()
         st.markdown("""
             <div class="metric-container">
                 <div class="metric-label">Average NAV</div>
                 <div class="metric-value">Rs. {:.2f}</div>
             </div>
-        """.format(avg_nav), unsafe_allow_html=True)
+        """.format(nav_stats['mean']), unsafe_allow_html=True)
     
     with col3:
-        max_nav = filtered_df[nav_col].max()
         st.markdown("""
             <div class="metric-container">
                 <div class="metric-label">Highest NAV</div>
                 <div class="metric-value">Rs. {:.2f}</div>
             </div>
-        """.format(max_nav), unsafe_allow_html=True)
+        """.format(nav_stats['max']), unsafe_allow_html=True)
     
     with col4:
-        min_nav = filtered_df[nav_col].min()
         st.markdown("""
             <div class="metric-container">
                 <div class="metric-label">Lowest NAV</div>
                 <div class="metric-value">Rs. {:.2f}</div>
             </div>
-        """.format(min_nav), unsafe_allow_html=True)
+        """.format(nav_stats['min']), unsafe_allow_html=True)
     
     st.markdown("""<div style="margin-top: -10px; margin-bottom: 10px;"></div>""", unsafe_allow_html=True)
     
-    # Add custom CSS for tabs and spacing
-    st.markdown("""
-        <style>
-        .stTabs [data-baseweb="tab-list"] button {
-            font-size: 16px !important;
-            padding: 12px 20px !important;
-            font-weight: 600 !important;
-            letter-spacing: 0.5px !important;
-        }
-        .stTabs [data-baseweb="tab-list"] {
-            gap: 15px !important;
-        }
-        .main { padding-top: 0.5rem !important; }
-        [data-testid="stSelectbox"] label { display: none !important; }
-        </style>
-    """, unsafe_allow_html=True)
-    
     # Tabs for different views - Reordered: Performance Analysis first
     tab1, tab2, tab3, tab4 = st.tabs([
         "📈 Performance Analysis",
@@ -603,7 +690,7 @@ def main():
         st.subheader("📈 Interactive Fund Performance Analysis")
         
         # Load performance data
-        performance_df = load_performance_data()
+        performance_df, perf_names = load_performance_data()
         
         if performance_df is not None:
             st.info("📌 Select a fund to view detailed performance analysis with interactive charts")
@@ -613,7 +700,7 @@ def main():
             available_funds = sorted(filtered_df[fund_col].unique().tolist())
             
             # Only show funds that exist in both filtered_df and performance_df
-            available_funds = [f for f in available_funds if f in performance_df['Fund Name'].values]
+            available_funds = [f for f in available_funds if f in perf_names]
             
             if available_funds:
                 selected_fund = st.selectbox(
@@ -646,7 +733,6 @@ def main():
         # Calculate start and end index
         start_idx = (st.session_state.current_page - 1) * ITEMS_PER_PAGE
         end_idx = start_idx + ITEMS_PER_PAGE
-        page_data = filtered_df.iloc[start_idx:end_idx]
         
         # Display sorting options
         col1, col2, col3 = st.columns([3, 2, 1])
@@ -654,7 +740,7 @@ def main():
         with col1:
             sort_by = st.selectbox(
                 "Sort by",
-                filtered_df.columns.tolist(),
+                tuple(df.columns),  # Same columns as the filtered slice, fixed once the data is loaded
                 index=0
             )
         with col2:
@@ -662,23 +748,35 @@ def main():
         with col3:
             st.write("")  # Spacing
         
-        # Sort the data
+        # Sort the data - only when the filters or sort settings change, not on every page click
         sort_reverse = sort_order == "⬆️ Descending"
-        display_df = filtered_df.sort_values(by=sort_by, ascending=not sort_reverse)
+        sort_key = (filter_sig, sort_by, sort_reverse)
         
-        # Recalculate page data after sorting
-        page_data = display_df.iloc[start_idx:end_idx]
+        # Recalculate page data after sorting - the first pages of a numeric sort only need a partial sort
+        sort_values = filtered_df[sort_by]
+        partial_sort = (
+            st.session_state.get('sort_key') != sort_key
+            and end_idx <= PARTIAL_SORT_MAX_ROWS
+            and pd.api.types.is_numeric_dtype(sort_values)
+            and not pd.api.types.is_bool_dtype(sort_values)
+            and end_idx <= sort_values.count()
+        )
+        if partial_sort:
+            top_rows = filtered_df.nlargest if sort_reverse else filtered_df.nsmallest
+            page_data = top_rows(end_idx, sort_by).iloc[start_idx:end_idx]
+        else:
+            page_data = filtered_df.take(sorted_positions(filtered_df, sort_key)[start_idx:end_idx])
         
-        # Remove Risk Rating column from display if it exists
+        # Hide the Risk Rating column from display if it exists (column_order, so no sliced copy)
         display_columns = [col for col in page_data.columns if col.lower() != 'risk rating']
-        page_data_display = page_data[display_columns]
         
-        # Display the table
+        # Display the table (handed over as Arrow so Streamlit skips its own conversion)
         st.dataframe(
-            page_data_display,
+            pa.Table.from_pandas(page_data, preserve_index=False),
             use_container_width=True,
             height=600,
-            hide_index=True
+            hide_index=True,
+            column_order=display_columns
         )
         
         # ==================== PAGINATION CONTROLS ====================
@@ -696,37 +794,38 @@ def main():
         col_prev, col_page_num, col_next, col_download = st.columns([1, 3, 1, 2])
         
         with col_prev:
-            if st.button("⬅️ Previous", key="btn_prev", use_container_width=True):
-                if st.session_state.current_page > 1:
-                    st.session_state.current_page -= 1
-                    st.rerun()
-                else:
-                    st.warning("Already on first page")
+            st.button(
+                "⬅️ Previous",
+                key="btn_prev",
+                on_click=go_to_previous_page,
+                disabled=st.session_state.current_page <= 1,
+                use_container_width=True
+            )
         
         with col_page_num:
-            # Page number selector
-            page_options = list(range(1, total_pages + 1))
-            selected_page = st.selectbox(
+            # Page number selector - kept in step with current_page before it renders
+            page_options = list(range(1, max(total_pages, 1) + 1))
+            st.session_state.page_selector = st.session_state.current_page
+            st.selectbox(
                 "Page",
                 page_options,
-                index=st.session_state.current_page - 1,
-                key="page_selector"
+                key="page_selector",
+                on_change=go_to_selected_page
             )
-            if selected_page != st.session_state.current_page:
-                st.session_state.current_page = selected_page
-                st.rerun()
         
         with col_next:
-            if st.button("Next ➡️", key="btn_next", use_container_width=True):
-                if st.session_state.current_page < total_pages:
-                    st.session_state.current_page += 1
-                    st.rerun()
-                else:
-                    st.warning("Already on last page")
+            st.button(
+                "Next ➡️",
+                key="btn_next",
+                on_click=go_to_next_page,
+                args=(total_pages,),
+                disabled=st.session_state.current_page >= total_pages,
+                use_container_width=True
+            )
         
         with col_download:
             # Download button for entire filtered dataset
-            csv = display_df.to_csv(index=False)
+            csv = filtered_csv_bytes(filter_sig, filename, sort_by, sort_reverse, filtered_df)
             st.download_button(
                 label="📥 Download All",
                 data=csv,
@@ -735,6 +834,9 @@ def main():
                 use_container_width=True
             )
     
+    # Tab 3 and Tab 4 aggregations, cached per filter result so tab switches are free
+    analytics = analytics_bundle(filter_sig, filename, fund_col, nav_col, cat_col, risk_col, filtered_df)
+    
     # ==================== TAB 3: ANALYTICS ====================
     with tab3:
         st.subheader("📊 Data Analytics")
@@ -743,24 +845,23 @@ def main():
         
         with col1:
             st.markdown("**NAV Distribution (Top 20)**")
-            st.bar_chart(filtered_df[nav_col].value_counts().sort_index().head(20))
+            st.bar_chart(analytics['nav_distribution'])
         
         with col2:
             if cat_col:
                 st.markdown("**Category Distribution**")
-                st.bar_chart(filtered_df[cat_col].value_counts())
+                st.bar_chart(analytics['category_counts'])
         
         col3, col4 = st.columns(2)
         
         with col3:
             if risk_col:
                 st.markdown("**Risk Rating Distribution**")
-                st.bar_chart(filtered_df[risk_col].value_counts())
+                st.bar_chart(analytics['risk_counts'])
         
         with col4:
             st.markdown("**Top 10 Highest NAV Funds**")
-            top_nav = filtered_df.nlargest(10, nav_col)[[fund_col, nav_col]]
-            st.dataframe(top_nav, use_container_width=True, hide_index=True)
+            st.dataframe(analytics['top_nav'], use_container_width=True, hide_index=True)
     
     # ==================== TAB 4: BY RISK ====================
     with tab4:
@@ -768,29 +869,19 @@ def main():
         
         if risk_col:
             # Risk statistics
-            risk_stats = filtered_df.groupby(risk_col).agg({
-                fund_col: 'count',
-                nav_col: ['mean', 'min', 'max']
-            }).round(2)
-            
-            risk_stats.columns = ['Number of Funds', 'Avg NAV', 'Min NAV', 'Max NAV']
-            risk_stats = risk_stats.sort_values('Number of Funds', ascending=False)
-            
             st.markdown("**Risk Rating Statistics**")
-            st.dataframe(risk_stats, use_container_width=True)
+            st.dataframe(analytics['risk_stats'], use_container_width=True)
             
             # Risk distribution
             col1, col2 = st.columns(2)
             
             with col1:
                 st.markdown("**Funds by Risk Rating**")
-                risk_counts = filtered_df[risk_col].value_counts()
-                st.bar_chart(risk_counts)
+                st.bar_chart(analytics['risk_counts'])
             
             with col2:
                 st.markdown("**Average NAV by Risk Rating**")
-                avg_nav_by_risk = filtered_df.groupby(risk_col)[nav_col].mean().sort_values(ascending=False)
-                st.bar_chart(avg_nav_by_risk)
+                st.bar_chart(analytics['avg_nav_by_risk'])
         else:
             st.info("Risk column not found in data")
 
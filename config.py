@@ -10,6 +10,11 @@ SIDEBAR_STATE = "expanded"
 
 # Pagination Settings
 ITEMS_PER_PAGE = 50
+PARTIAL_SORT_MAX_ROWS = 500  # Pages ending within this many rows use nsmallest/nlargest instead of a full sort
+
+# Results kept per cache keyed by filter state or fund selection - each search keystroke or
+# slider position is a new key, so these caches would otherwise grow for the life of the process
+FILTER_CACHE_MAX_ENTRIES = 32
 
 # Risk Level Configuration
 RISK_ORDER = ['Very Low', 'Low', 'Medium', 'High']
@@ -22,6 +27,13 @@ RISK_RATING_MAPPINGS = {
     'high': ['a-(f)', 'a-', 'bbb(f)', 'bbb', 'bbb+(f)', 'bbb+', 'bbb-(f)', 'bbb-', 'bb(f)', 'bb', 'b(f)', 'b']
 }
 
+# Reverse lookup: lowercased rating -> risk level (e.g. 'aa+(f)' -> 'Very Low')
+RISK_LOOKUP = {
+    rating: level.replace('_', ' ').title()
+    for level, ratings in RISK_RATING_MAPPINGS.items()
+    for rating in ratings
+}
+
 # Data Folder
 DATA_FOLDER = "data"
 CLEANED_CSV_NAME = "funds_clean.csv"
@@ -38,3 +50,27 @@ COLUMN_KEYWORDS = {
 
 # NAV Range Defaults
 NAV_RANGE_DEFAULT = [0, 100]
+
+# Column dtypes for known CSV headers (strings as category; prices stay float64 so
+# 4-decimal NAVs display and round exactly as written)
+CSV_SCHEMA = {
+    'Fund Name': 'category',
+    'Company': 'category',
+    'AMC': 'category',
+    'Category': 'category',
+    'Risk Rating': 'category',
+    'NAV': 'float64',
+    'Offer Price': 'float64'
+}
+
+# Performance Summary columns (period returns in display order)
+PERFORMANCE_PERIODS = ['YTD', 'MTD', '1 Day', '15 Days', '30 Days',
+                       '90 Days', '180 Days', '270 Days', '365 Days', '2 Years', '3 Years']
+PERFORMANCE_INFO_COLUMNS = ['Fund Name', 'Validity Date']
+
+# Line colors for the Fund Comparison chart, cycled per selected fund
+COMPARISON_COLORS = (
+    '#667eea', '#764ba2', '#f093fb', '#4facfe',
+    '#43e97b', '#fa709a', '#30cfd0', '#330867',
+    '#ff6b6b', '#4ecdc4', '#45b7d1', '#96ceb4'
+)
@@ -0,0 +1,54 @@
+"""
+Data parsing helpers shared by the Dashboard and Fund Comparison pages
+"""
+
+import json
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import streamlit as st
+from config import CSV_SCHEMA
+
+def parse_accounting_numbers(series):
+    """Parse numbers written like "1,234.5" or "(12.3)" (negative) into floats, NaN where unparseable"""
+    values = series.str.replace(',', '', regex=False).str.replace(r'^\((.*)\)$', r'-\1', regex=True)
+    return pd.to_numeric(values, errors='coerce').astype('float64')
+
+@st.cache_resource
+def lowercased_names(filename, fund_col, _names):
+    """Fund names lowercased once into a NumPy string array for substring search"""
+    return np.asarray(_names.astype('string').str.lower().fillna(''), dtype=str)
+
+def read_csv_typed(csv_path):
+    """Read every column of a CSV, with explicit dtypes for the known headers and inference for the rest"""
+    header = pd.read_csv(csv_path, nrows=0).columns
+    return pd.read_csv(
+        csv_path,
+        dtype={col: CSV_SCHEMA[col] for col in header if col in CSV_SCHEMA}
+    )
+
+def sidecar_tag(spec):
+    """Bytes describing how a sidecar was built (dtype schema or column list), kept in its Parquet metadata"""
+    return json.dumps(spec, sort_keys=True).encode()
+
+def read_sidecar(csv_path, tag):
+    """Frame from the Parquet sidecar next to a CSV, or None when it is missing, older than the CSV,
+    built with a different tag or unreadable"""
+    parquet_path = csv_path.with_suffix(".parquet")
+    if parquet_path.exists() and parquet_path.stat().st_mtime >= csv_path.stat().st_mtime:
+        try:
+            if pq.read_schema(parquet_path).metadata.get(b'csv_schema') == tag:
+                return pd.read_parquet(parquet_path, engine="pyarrow")
+        except Exception:
+            pass  # Corrupt sidecar - the caller rebuilds it from the CSV
+    return None
+
+def write_sidecar(df, csv_path, tag):
+    """Save a frame read from a CSV as its Parquet sidecar, tagged so a schema or column change rebuilds it"""
+    try:
+        table = pa.Table.from_pandas(df)
+        table = table.replace_schema_metadata({**table.schema.metadata, b'csv_schema': tag})
+        pq.write_table(table, csv_path.with_suffix(".parquet"), compression="zstd")
+    except Exception:
+        pass  # Read-only data folder - keep serving the CSV
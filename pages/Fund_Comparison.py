@@ -5,8 +5,12 @@ Compare multiple funds side-by-side with interactive performance charts
 
 import streamlit as st
 import pandas as pd
+import numpy as np
+import os
 from pathlib import Path
 import plotly.graph_objects as go
+from config import RISK_LOOKUP, RISK_ORDER, CSV_SCHEMA, PERFORMANCE_PERIODS, COMPARISON_COLORS, FILTER_CACHE_MAX_ENTRIES
+from data_utils import parse_accounting_numbers, lowercased_names, read_csv_typed, sidecar_tag, read_sidecar, write_sidecar
 
 # Page configuration
 st.set_page_config(
@@ -94,32 +98,46 @@ load_css()
 
 @st.cache_data
 def load_csv():
-    """Load CSV file from data folder"""
+    """Load CSV file from data folder - the cleaned file via its Parquet sidecar when up to date - plus its filter options"""
     data_folder = Path("data")
     cleaned_csv = data_folder / "funds_clean.csv"
     if cleaned_csv.exists():
-        try:
-            df = pd.read_csv(cleaned_csv)
-            return df, cleaned_csv.name
-        except Exception as e:
-            st.warning(f"Could not load cleaned CSV: {e}")
+        # Same CSV_SCHEMA-tagged sidecar as the dashboard - prepare_columns still runs on every load,
+        # so edits to the rating mappings apply without touching the CSV
+        schema_tag = sidecar_tag(CSV_SCHEMA)
+        df = read_sidecar(cleaned_csv, schema_tag)
+        if df is None:
+            try:
+                df = read_csv_typed(cleaned_csv)
+            except Exception as e:
+                st.warning(f"Could not load cleaned CSV: {e}")
+            else:
+                write_sidecar(df, cleaned_csv, schema_tag)
+        if df is not None:
+            df = prepare_columns(df)
+            return df, cleaned_csv.name, filter_options(df)
     
-    csv_files = list(data_folder.glob("*.csv"))
-    if not csv_files:
-        return None, None
+    # Fall back to the largest CSV, found in one scandir pass over the folder
+    if not data_folder.is_dir():
+        return None, None, None
+    with os.scandir(data_folder) as entries:
+        csv_entries = [entry for entry in entries if entry.name.endswith(".csv") and entry.is_file()]
+    if not csv_entries:
+        return None, None, None
     
-    csv_file = max(csv_files, key=lambda x: x.stat().st_size)
+    csv_file = Path(max(csv_entries, key=lambda entry: entry.stat().st_size).path)
     try:
-        df = pd.read_csv(csv_file)
-        return df, csv_file.name
+        df = prepare_columns(pd.read_csv(csv_file))
+        return df, csv_file.name, filter_options(df)
     except Exception as e:
         st.error(f"Error loading CSV: {e}")
-        return None, None
+        return None, None, None
 
-def detect_columns(df):
-    """Auto-detect important columns"""
+@st.cache_data
+def detect_columns(columns):
+    """Auto-detect important columns from a tuple of column names"""
     col_map = {}
-    for col in df.columns:
+    for col in columns:
         col_lower = col.lower()
         if 'name' in col_lower or 'fund' in col_lower:
             col_map['fund_name'] = col
@@ -133,33 +151,113 @@ def detect_columns(df):
             col_map['risk'] = col
     return col_map
 
-def convert_rating_to_risk_level(rating):
-    """Convert MUFAP rating to user-friendly risk level"""
-    if pd.isna(rating) or rating == '':
-        return 'High'
+def prepare_columns(df):
+    """Cast the detected text columns to category and add Risk Level"""
+    col_map = detect_columns(tuple(df.columns))
+    for key in ('fund_name', 'category', 'risk'):
+        if key in col_map:
+            df[col_map[key]] = df[col_map[key]].astype('category')
     
-    rating_str = str(rating).strip().lower()
-    
-    if rating_str in ['aaa(f)', 'aaa', 'aa+(f)', 'aa+']:
-        return 'Very Low'
-    elif rating_str in ['aa(f)', 'aa', 'aa-(f)', 'aa-']:
-        return 'Low'
-    elif rating_str in ['a+(f)', 'a+', 'a(f)', 'a']:
-        return 'Medium'
-    else:
-        return 'High'
+    # Convert Risk Ratings with one vectorized lookup - unknown or missing ratings are High
+    if col_map.get('risk'):
+        ratings = df[col_map['risk']].astype('string').str.strip().str.lower()
+        df['Risk Level'] = ratings.map(RISK_LOOKUP).fillna('High').astype('category')
+    return df
+
+def filter_options(df):
+    """Category and risk level choices and NAV limits for the sidebar filters"""
+    col_map = detect_columns(tuple(df.columns))
+    cat_col = col_map.get('category')
+    nav_col = col_map.get('nav')
+    risk_col = 'Risk Level' if 'Risk Level' in df.columns else col_map.get('risk')
+    present_risks = set(df[risk_col].dropna().unique().tolist()) if risk_col else set()
+    return {
+        'categories': sorted(df[cat_col].dropna().unique().tolist()) if cat_col else [],
+        'risks': [risk for risk in RISK_ORDER if risk in present_risks],
+        'nav_min': float(df[nav_col].min()) if nav_col else None,
+        'nav_max': float(df[nav_col].max()) if nav_col else None
+    }
 
 @st.cache_data
 def load_performance_data():
-    """Load performance data from summary CSV"""
+    """Load performance data from summary CSV, plus a Fund Name -> row position lookup"""
     try:
         performance_file = Path("data") / "Performance Summary  MUTUAL FUNDS ASSOCIATION OF PAKISTAN.csv"
         if performance_file.exists():
-            df = pd.read_csv(performance_file, skiprows=1)
-            return df
+            # Skip the title row, and only read the fund name and period columns
+            header = pd.read_csv(performance_file, skiprows=1, nrows=0).columns
+            periods = [col for col in PERFORMANCE_PERIODS if col in header]
+            usecols = ['Fund Name'] + periods
+            
+            # The sidecar holds those columns as text, tagged with the column list
+            columns_tag = sidecar_tag(usecols)
+            df = read_sidecar(performance_file, columns_tag)
+            if df is None:
+                df = pd.read_csv(performance_file, skiprows=1, usecols=usecols, dtype='string')
+                write_sidecar(df, performance_file, columns_tag)
+            
+            # Parse the periods as numbers up front ("(1.10)" is a negative return, as on the dashboard)
+            for col in periods:
+                df[col] = parse_accounting_numbers(df[col])
+            
+            name_to_idx = {}
+            for idx, name in enumerate(df['Fund Name']):
+                name_to_idx.setdefault(name, idx)  # First row wins, like the old == filter + iloc[0]
+            return df, name_to_idx
     except Exception as e:
         st.warning(f"Could not load performance data: {e}")
-    return None
+    return None, {}
+
+# Best / worst performer card, filled in with format_map
+PERFORMER_CARD = """
+<div style="background: {background}; 
+            padding: 30px 20px; border-radius: 10px; text-align: center; color: white; 
+            min-height: 200px; display: flex; flex-direction: column; justify-content: center; 
+            align-items: center; width: 100%;">
+    <p style="margin: 5px 0; font-size: 12px; opacity: 0.9; width: 100%;">{label}</p>
+    <p style="margin: 10px 0; font-size: 18px; font-weight: bold; word-wrap: break-word; width: 100%;">{fund}</p>
+    <p style="margin: 5px 0; font-size: 14px; color: {color}; width: 100%;">↑ {performance}</p>
+</div>
+"""
+
+# cache_resource returns the same Figure instance without unpickling a copy - it is never modified after building
+@st.cache_resource(max_entries=FILTER_CACHE_MAX_ENTRIES)
+def comparison_figure(periods, fund_names, values):
+    """Multi-fund line chart of returns across periods, one row of values per fund name"""
+    fig = go.Figure()
+    
+    for idx, fund_name in enumerate(fund_names):
+        color = COMPARISON_COLORS[idx % len(COMPARISON_COLORS)]
+        fig.add_trace(go.Scattergl(
+            x=periods,
+            y=values[idx],
+            mode='lines+markers',
+            name=fund_name,
+            line={'color': color, 'width': 3},
+            marker={'size': 8, 'color': color},
+            hovertemplate=f'<b>{fund_name}</b><br>Period: %{{x}}<br>Return: %{{y:.2f}}%<extra></extra>'
+        ))
+    
+    fig.update_layout(
+        title="Fund Performance Comparison - Multi-Period Analysis",
+        xaxis_title="Time Period",
+        yaxis_title="Return (%)",
+        height=600,
+        template='plotly_dark',
+        hovermode='x unified',
+        showlegend=True,
+        legend=dict(
+            orientation="v",
+            yanchor="top",
+            y=0.99,
+            xanchor="left",
+            x=0.01
+        ),
+        margin=dict(b=80)
+    )
+    
+    fig.update_xaxes(tickangle=-45)
+    return fig
 
 # Main app
 # Page Tab Switcher UI with centered layout
@@ -177,14 +275,14 @@ st.title("🔄 Fund Comparison Analysis")
 st.markdown("Compare multiple funds side-by-side with detailed performance analytics")
 
 # Load data
-df, filename = load_csv()
+df, filename, options = load_csv()
 
 if df is None:
     st.error("❌ No CSV file found!")
     st.stop()
 
 # Detect columns
-col_map = detect_columns(df)
+col_map = detect_columns(tuple(df.columns))
 
 if 'fund_name' not in col_map:
     st.error("❌ Could not find fund name column")
@@ -194,9 +292,8 @@ if 'nav' not in col_map:
     st.error("❌ Could not find NAV column")
     st.stop()
 
-# Convert Risk Ratings
-if col_map.get('risk'):
-    df['Risk Level'] = df[col_map['risk']].apply(convert_rating_to_risk_level)
+# Risk Level is converted from the ratings in load_csv
+if 'Risk Level' in df.columns:
     col_map['risk_level'] = 'Risk Level'
 
 # Initialize session state for comparison
@@ -218,9 +315,7 @@ if 'comp_category_filter' not in st.session_state:
 if 'comp_risk_filter' not in st.session_state:
     st.session_state.comp_risk_filter = []
 if 'comp_nav_range' not in st.session_state:
-    nav_min = float(df[nav_col].min())
-    nav_max = float(df[nav_col].max())
-    st.session_state.comp_nav_range = [nav_min, nav_max]
+    st.session_state.comp_nav_range = [options['nav_min'], options['nav_max']]
 if 'comp_search_term' not in st.session_state:
     st.session_state.comp_search_term = ""
 
@@ -237,7 +332,7 @@ st.session_state.comp_search_term = search_term
 st.sidebar.markdown("---")
 
 # Category filter
-categories = sorted(df[cat_col].dropna().unique().tolist()) if cat_col else []
+categories = options['categories']
 if categories:
     st.sidebar.markdown("### 📂 Category")
     selected_categories = st.sidebar.multiselect(
@@ -251,14 +346,10 @@ if categories:
 
 # Risk filter
 if risk_col and risk_col in df.columns:
-    risk_order = ['Very Low', 'Low', 'Medium', 'High']
-    all_risks = df[risk_col].dropna().unique().tolist()
-    risks = [r for r in risk_order if r in all_risks]
-    
     st.sidebar.markdown("### ⚠️ Risk Level")
     selected_risks = st.sidebar.multiselect(
         "Select Risk Levels",
-        risks,
+        options['risks'],
         default=st.session_state.comp_risk_filter,
         key="comp_risk_select"
     )
@@ -267,13 +358,10 @@ if risk_col and risk_col in df.columns:
 
 # NAV range filter
 st.sidebar.markdown("### 💰 NAV Range (Rs.)")
-nav_min = float(df[nav_col].min())
-nav_max = float(df[nav_col].max())
-
 nav_range = st.sidebar.slider(
     "Select NAV Range",
-    nav_min,
-    nav_max,
+    options['nav_min'],
+    options['nav_max'],
     (st.session_state.comp_nav_range[0], st.session_state.comp_nav_range[1]),
     step=0.5
 )
@@ -281,235 +369,176 @@ st.session_state.comp_nav_range = list(nav_range)
 
 st.sidebar.markdown("---")
 
-# Apply filters
-filtered_df = df.copy()
+# Apply filters as one boolean mask over df and index once, instead of re-slicing a copy per filter
+mask = np.ones(len(df), dtype=bool)
 
 if search_term:
-    filtered_df = filtered_df[
-        filtered_df[fund_col].str.contains(search_term, case=False, na=False)
-    ]
+    # Plain substring match on the pre-lowercased names, which line up with df's rows
+    mask &= np.char.find(lowercased_names(filename, fund_col, df[fund_col]), search_term.lower()) >= 0
 
 if st.session_state.comp_category_filter and cat_col:
-    filtered_df = filtered_df[filtered_df[cat_col].isin(st.session_state.comp_category_filter)]
+    mask &= df[cat_col].isin(st.session_state.comp_category_filter).to_numpy()
 
-if st.session_state.comp_risk_filter and 'Risk Level' in filtered_df.columns:
-    filtered_df = filtered_df[filtered_df['Risk Level'].isin(st.session_state.comp_risk_filter)]
+if st.session_state.comp_risk_filter and 'Risk Level' in df.columns:
+    mask &= df['Risk Level'].isin(st.session_state.comp_risk_filter).to_numpy()
 
-filtered_df = filtered_df[
-    (filtered_df[nav_col] >= st.session_state.comp_nav_range[0]) &
-    (filtered_df[nav_col] <= st.session_state.comp_nav_range[1])
-]
+nav_values = df[nav_col].to_numpy()
+mask &= (nav_values >= st.session_state.comp_nav_range[0]) & (nav_values <= st.session_state.comp_nav_range[1])
 
-# Main content - Split layout
-col_left, col_right = st.columns([1, 2.5], gap="large")
+filtered_df = df[mask]
 
-with col_left:
-    st.subheader("📋 Select Funds")
+# Main content - Split layout
+# Selecting funds only reruns this fragment; sidebar filter changes still rerun the whole page
+@st.fragment
+def render_comparison(filtered_df, fund_col, nav_col, cat_col):
+    """Fund selector, best/worst cards, comparison chart and detailed table"""
+    # First row per fund, indexed by name, for the detail cards and table lookups
+    fund_rows = filtered_df.drop_duplicates(fund_col).set_index(fund_col)
     
-    available_funds = sorted(filtered_df[fund_col].unique().tolist())
+    col_left, col_right = st.columns([1, 2.5], gap="large")
     
-    if available_funds:
-        # Multi-select for funds
-        selected_funds = st.multiselect(
-            "Choose funds to compare:",
-            available_funds,
-            default=st.session_state.comparison_funds,
-            key="fund_selector"
-        )
-        st.session_state.comparison_funds = selected_funds
+    with col_left:
+        st.subheader("📋 Select Funds")
         
-        # Display best and worst performing funds
-        if selected_funds:
-            st.markdown("---")
-            st.markdown("### 🏆 Best & Worst Performers")
-            
-            # Load performance data to find best and worst
-            performance_df = load_performance_data()
+        available_funds = sorted(filtered_df[fund_col].unique().tolist())
+        
+        if available_funds:
+            # Multi-select for funds
+            selected_funds = st.multiselect(
+                "Choose funds to compare:",
+                available_funds,
+                default=st.session_state.comparison_funds,
+                key="fund_selector"
+            )
+            st.session_state.comparison_funds = selected_funds
             
-            if performance_df is not None:
-                # Get 1-year (365 Days) performance if available, otherwise use 3 Years
-                perf_period = '365 Days' if '365 Days' in performance_df.columns else '3 Years'
-                
-                # Find best and worst from selected funds
-                best_fund = None
-                worst_fund = None
-                best_perf = float('-inf')
-                worst_perf = float('inf')
+            # Display best and worst performing funds
+            if selected_funds:
+                st.markdown("---")
+                st.markdown("### 🏆 Best & Worst Performers")
                 
-                for fund_name in selected_funds:
-                    fund_perf = performance_df[performance_df['Fund Name'] == fund_name]
-                    if not fund_perf.empty and perf_period in fund_perf.columns:
-                        try:
-                            perf_val = float(fund_perf.iloc[0][perf_period])
-                            if perf_val > best_perf:
-                                best_perf = perf_val
-                                best_fund = fund_name
-                            if perf_val < worst_perf:
-                                worst_perf = perf_val
-                                worst_fund = fund_name
-                        except:
-                            pass
+                # Load performance data to find best and worst
+                performance_df, name_to_idx = load_performance_data()
                 
-                # Display best and worst performers
-                col1, col2 = st.columns(2, gap="medium")
+                if performance_df is not None:
+                    # Get 1-year (365 Days) performance if available, otherwise use 3 Years
+                    perf_period = '365 Days' if '365 Days' in performance_df.columns else '3 Years'
+                    
+                    # Find best and worst from selected funds in one vectorized pass (non-numeric values are skipped)
+                    best_fund = None
+                    worst_fund = None
+                    if perf_period in performance_df.columns:
+                        positions = [name_to_idx[fund_name] for fund_name in selected_funds if fund_name in name_to_idx]
+                        period_values = performance_df[perf_period].iloc[positions]
+                        period_values.index = performance_df['Fund Name'].iloc[positions]
+                        period_values = period_values.dropna()
+                        if not period_values.empty:
+                            best_fund, worst_fund = period_values.idxmax(), period_values.idxmin()
+                            best_perf, worst_perf = period_values.max(), period_values.min()
+                    
+                    # Display best and worst performers
+                    col1, col2 = st.columns(2, gap="medium")
+                    
+                    with col1:
+                        st.markdown(PERFORMER_CARD.format_map({
+                            'background': "linear-gradient(135deg, #667eea 0%, #764ba2 100%)",
+                            'label': "⭐ Best Fund",
+                            'fund': best_fund or "N/A",
+                            'color': "#4ade80",
+                            'performance': f"{best_perf:.2f}%" if best_fund else "N/A"
+                        }), unsafe_allow_html=True)
+                    
+                    with col2:
+                        st.markdown(PERFORMER_CARD.format_map({
+                            'background': "linear-gradient(135deg, #ff6b6b 0%, #ee5a6f 100%)",
+                            'label': "📉 Worst Fund",
+                            'fund': worst_fund or "N/A",
+                            'color': "#fff9c4",
+                            'performance': f"{worst_perf:.2f}%" if worst_fund else "N/A"
+                        }), unsafe_allow_html=True)
                 
-                with col1:
-                    st.markdown("""
-                    <div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); 
-                                padding: 30px 20px; border-radius: 10px; text-align: center; color: white; 
-                                min-height: 200px; display: flex; flex-direction: column; justify-content: center; 
-                                align-items: center; width: 100%;">
-                        <p style="margin: 5px 0; font-size: 12px; opacity: 0.9; width: 100%;">⭐ Best Fund</p>
-                        <p style="margin: 10px 0; font-size: 18px; font-weight: bold; word-wrap: break-word; width: 100%;">""" + (best_fund if best_fund else "N/A") + """</p>
-                        <p style="margin: 5px 0; font-size: 14px; color: #4ade80; width: 100%;">↑ """ + (f"{best_perf:.2f}%" if best_perf != float('-inf') else "N/A") + """</p>
-                    </div>
-                    """, unsafe_allow_html=True)
+                # List selected funds with their NAV
+                st.markdown("---")
+                st.markdown("### 💾 Selected Fund Details")
+                fund_info = fund_rows.loc[selected_funds]
+                no_values = ["N/A"] * len(fund_info)
+                categories = fund_info[cat_col] if cat_col else no_values
+                risks = fund_info['Risk Level'] if 'Risk Level' in fund_info.columns else no_values
                 
-                with col2:
-                    st.markdown("""
-                    <div style="background: linear-gradient(135deg, #ff6b6b 0%, #ee5a6f 100%); 
-                                padding: 30px 20px; border-radius: 10px; text-align: center; color: white; 
-                                min-height: 200px; display: flex; flex-direction: column; justify-content: center; 
-                                align-items: center; width: 100%;">
-                        <p style="margin: 5px 0; font-size: 12px; opacity: 0.9; width: 100%;">📉 Worst Fund</p>
-                        <p style="margin: 10px 0; font-size: 18px; font-weight: bold; word-wrap: break-word; width: 100%;">""" + (worst_fund if worst_fund else "N/A") + """</p>
-                        <p style="margin: 5px 0; font-size: 14px; color: #fff9c4; width: 100%;">↑ """ + (f"{worst_perf:.2f}%" if worst_perf != float('inf') else "N/A") + """</p>
+                # All cards go out in one markdown element instead of one per fund
+                cards = []
+                for fund_name, nav_val, category, risk in zip(selected_funds, fund_info[nav_col], categories, risks):
+                    cards.append(f"""
+                    <div style="background-color: #1f3a93; padding: 10px; border-radius: 5px; margin: 5px 0;">
+                        <strong>{fund_name}</strong><br/>
+                        NAV: Rs. {nav_val:.2f} | {category} | Risk: {risk}
                     </div>
-                    """, unsafe_allow_html=True)
-            
-            # List selected funds with their NAV
-            st.markdown("---")
-            st.markdown("### 💾 Selected Fund Details")
-            for fund_name in selected_funds:
-                fund_info = filtered_df[filtered_df[fund_col] == fund_name].iloc[0]
-                nav_val = fund_info[nav_col]
-                category = fund_info[cat_col] if cat_col else "N/A"
-                risk = fund_info.get('Risk Level', 'N/A') if 'Risk Level' in fund_info else "N/A"
-                
-                st.markdown(f"""
-                <div style="background-color: #1f3a93; padding: 10px; border-radius: 5px; margin: 5px 0;">
-                    <strong>{fund_name}</strong><br/>
-                    NAV: Rs. {nav_val:.2f} | {category} | Risk: {risk}
-                </div>
-                """, unsafe_allow_html=True)
-    else:
-        st.warning("⚠️ No funds match the selected filters")
-
-with col_right:
-    # Load performance data
-    performance_df = load_performance_data()
+                    """)
+                st.markdown("".join(cards), unsafe_allow_html=True)
+        else:
+            st.warning("⚠️ No funds match the selected filters")
     
-    if performance_df is not None and st.session_state.comparison_funds:
+    with col_right:
+        # Nothing to chart or tabulate until funds are selected - skip loading the performance data too
+        if not st.session_state.comparison_funds:
+            st.info("📌 Select funds from the left panel to compare")
+            return
+        
+        # Load performance data
+        performance_df, name_to_idx = load_performance_data()
+        
+        if performance_df is None:
+            st.warning("⚠️ Performance data file not found")
+            return
+        
         st.subheader("📈 Performance Comparison")
         
         # Time period selector
-        performance_columns = ['YTD', 'MTD', '1 Day', '15 Days', '30 Days', 
-                               '90 Days', '180 Days', '270 Days', '365 Days', '2 Years', '3 Years']
-        available_columns = [col for col in performance_columns if col in performance_df.columns]
+        available_columns = [col for col in PERFORMANCE_PERIODS if col in performance_df.columns]
         
         # Create line chart comparing selected funds across time periods
-        if st.session_state.comparison_funds:
-            # Prepare data for line chart
-            line_data = []
-            
-            for fund_name in st.session_state.comparison_funds:
-                fund_perf = performance_df[performance_df['Fund Name'] == fund_name]
-                if not fund_perf.empty:
-                    perf_values = []
-                    for period in available_columns:
-                        if period in fund_perf.columns:
-                            try:
-                                perf_val = float(fund_perf.iloc[0][period])
-                                perf_values.append(perf_val)
-                            except:
-                                perf_values.append(None)
-                        else:
-                            perf_values.append(None)
-                    
-                    if perf_values and any(v is not None for v in perf_values):
-                        line_data.append({
-                            'fund': fund_name,
-                            'values': perf_values
-                        })
-            
-            if line_data:
-                # Create line chart
-                fig = go.Figure()
-                
-                # Define colors for different funds
-                colors = [
-                    '#667eea', '#764ba2', '#f093fb', '#4facfe',
-                    '#43e97b', '#fa709a', '#30cfd0', '#330867',
-                    '#ff6b6b', '#4ecdc4', '#45b7d1', '#96ceb4'
-                ]
-                
-                for idx, data in enumerate(line_data):
-                    color = colors[idx % len(colors)]
-                    fig.add_trace(go.Scatter(
-                        x=available_columns,
-                        y=data['values'],
-                        mode='lines+markers',
-                        name=data['fund'],
-                        line=dict(color=color, width=3),
-                        marker=dict(size=8, color=color),
-                        hovertemplate='<b>' + data['fund'] + '</b><br>Period: %{x}<br>Return: %{y:.2f}%<extra></extra>'
-                    ))
-                
-                fig.update_layout(
-                    title="Fund Performance Comparison - Multi-Period Analysis",
-                    xaxis_title="Time Period",
-                    yaxis_title="Return (%)",
-                    height=600,
-                    template='plotly_dark',
-                    hovermode='x unified',
-                    showlegend=True,
-                    legend=dict(
-                        orientation="v",
-                        yanchor="top",
-                        y=0.99,
-                        xanchor="left",
-                        x=0.01
-                    ),
-                    margin=dict(b=80)
-                )
-                
-                fig.update_xaxes(tickangle=-45)
-                
-                st.plotly_chart(fig, use_container_width=True)
-            else:
-                st.info("📌 No performance data available for selected funds")
-            
-            # Detailed comparison table
-            st.markdown("---")
-            st.markdown("### 📑 Detailed Performance Table")
-            
-            detailed_table = []
-            for fund_name in st.session_state.comparison_funds:
-                fund_data = filtered_df[filtered_df[fund_col] == fund_name]
-                fund_perf = performance_df[performance_df['Fund Name'] == fund_name]
-                
-                if not fund_data.empty and not fund_perf.empty:
-                    nav_val = fund_data.iloc[0][nav_col]
-                    category = fund_data.iloc[0][cat_col] if cat_col else "N/A"
-                    
-                    perf_dict = {'Fund Name': fund_name, 'NAV': f"Rs. {nav_val:.2f}", 'Category': category}
-                    
-                    for period in available_columns:
-                        if period in fund_perf.columns:
-                            try:
-                                perf_val = float(fund_perf.iloc[0][period])
-                                perf_dict[period] = f"{perf_val:.2f}%"
-                            except:
-                                perf_dict[period] = "N/A"
-                    
-                    detailed_table.append(perf_dict)
-            
-            if detailed_table:
-                table_df = pd.DataFrame(detailed_table)
-                st.dataframe(table_df, use_container_width=True, hide_index=True)
+        # One (funds x periods) array for all selected funds - NaN values become gaps in the line
+        chart_funds = [fund_name for fund_name in st.session_state.comparison_funds if fund_name in name_to_idx]
+        chart_values = performance_df[available_columns].iloc[
+            [name_to_idx[fund_name] for fund_name in chart_funds]
+        ].to_numpy(dtype='float64')
+        has_data = ~np.isnan(chart_values).all(axis=1)
+        
+        if has_data.any():
+            # Figure is cached per selection, and the fixed key lets the chart update in place
+            fig = comparison_figure(
+                tuple(available_columns),
+                tuple(fund_name for fund_name, keep in zip(chart_funds, has_data) if keep),
+                chart_values[has_data]
+            )
+            st.plotly_chart(fig, use_container_width=True, key="fund_comparison_chart")
         else:
-            st.info("📌 Select funds to view performance comparison")
-    elif performance_df is None:
-        st.warning("⚠️ Performance data file not found")
-    else:
-        st.info("📌 Select funds from the left panel to compare")
+            st.info("📌 No performance data available for selected funds")
+        
+        # Detailed comparison table
+        st.markdown("---")
+        st.markdown("### 📑 Detailed Performance Table")
+        
+        # One lookup per side for all selected funds instead of a scan per fund
+        table_funds = [
+            fund_name for fund_name in st.session_state.comparison_funds
+            if fund_name in fund_rows.index and fund_name in name_to_idx
+        ]
+        
+        if table_funds:
+            fund_info = fund_rows.loc[table_funds]
+            positions = [name_to_idx[fund_name] for fund_name in table_funds]
+            period_values = performance_df[available_columns].iloc[positions]
+            
+            # Cells stay numeric (sortable, and smaller on the wire) - the column config does the formatting
+            table_df = pd.DataFrame({
+                'Fund Name': table_funds,
+                'NAV': fund_info[nav_col].to_numpy(),
+                'Category': fund_info[cat_col].to_numpy() if cat_col else "N/A"
+            })
+            table_df = pd.concat([table_df, period_values.reset_index(drop=True)], axis=1)
+            column_config = {period: st.column_config.NumberColumn(format="%.2f%%") for period in available_columns}
+            column_config['NAV'] = st.column_config.NumberColumn(format="Rs. %.2f")
+            st.dataframe(table_df, use_container_width=True, hide_index=True, column_config=column_config)
+
+render_comparison(filtered_df, fund_col, nav_col, cat_col)
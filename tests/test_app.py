@@ -0,0 +1,31 @@
+"""
+Streamlit AppTest checks for the Dashboard page
+"""
+
+from pathlib import Path
+
+import pytest
+from streamlit.testing.v1 import AppTest
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+@pytest.fixture
+def dashboard(monkeypatch):
+    """The Dashboard run once from the repo root, so its data/ and styles/ paths resolve"""
+    monkeypatch.chdir(REPO_ROOT)
+    at = AppTest.from_file(str(REPO_ROOT / "app.py"), default_timeout=60)
+    at.run()
+    assert not at.exception
+    return at
+
+def period_radio(at):
+    """The Performance Analysis time period radio"""
+    return next(radio for radio in at.radio if radio.key == "period_radio")
+
+def test_consecutive_period_changes_all_register(dashboard):
+    """Every period click sticks, not just every other one"""
+    for period in ["90 Days", "YTD", "1 Day"]:
+        period_radio(dashboard).set_value(period).run()
+        assert not dashboard.exception
+        assert period_radio(dashboard).value == period
+        assert dashboard.session_state.selected_period == period